@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """lambda_agent.py
 Predictive Auto-Scaling + Self-Heal for ECS Fargate
-Dependencies: boto3 (available in Lambda), botocore
+Dependencies: boto3 (available in Lambda), botocore; numpy + numba optional (faster smoothing of long series)
 Design goals:
 - No external heavy deps so it can run in Lambda without layers.
 - Simple, robust forecasting (double exponential smoothing)
@@ -14,9 +14,12 @@ import json
 import math
 import time
 import logging
-from datetime import datetime, timedelta
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from datetime import datetime, timezone
+import urllib3
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 LOG = logging.getLogger()
@@ -32,108 +35,323 @@ PERIOD = int(os.getenv('METRIC_PERIOD', '60'))  # seconds
 LOOKBACK_MINUTES = int(os.getenv('LOOKBACK_MIN', '10'))
 PREDICT_AHEAD_MIN = int(os.getenv('PREDICT_AHEAD_MIN', '5'))
 TARGET_CPU_PER_TASK = float(os.getenv('TARGET_CPU_PER_TASK', '60.0'))  # percent
+HOLT_ALPHA = float(os.getenv('HOLT_ALPHA', '0.5'))  # level smoothing
+HOLT_BETA = float(os.getenv('HOLT_BETA', '0.3'))  # trend smoothing
+# number of periods ahead: ceil(PREDICT_AHEAD_MIN * 60 / PERIOD), fixed for the container lifetime
+N_AHEAD = max(1, -(-(PREDICT_AHEAD_MIN * 60) // PERIOD))
 SLACK_WEBHOOK_PARAM = os.getenv('SLACK_WEBHOOK_SSM_PARAM')  # optional: name in SSM
 SLACK_WEBHOOK = os.getenv('SLACK_WEBHOOK')  # fallback to direct env
+HEAL_DESCRIBE_STOPPED = os.getenv('HEAL_DESCRIBE_STOPPED', 'false').lower() == 'true'  # include stop reasons in Slack
+HOLT_STATE_PATH = os.getenv('HOLT_STATE_PATH', '/tmp/holt_state.json')  # survives warm invocations
 
-# boto3 clients
-boto3.setup_default_session(region_name=REGION)
-cw = boto3.client('cloudwatch')
-ecs = boto3.client('ecs')
-ssm = boto3.client('ssm')
+SLACK_WEBHOOK_TTL = 300  # seconds to reuse the SSM webhook value across warm invocations
+SLACK_JOIN_TIMEOUT = 0.5  # seconds the handler waits for the background Slack POST
+
+# boto3 clients (module scope so warm invocations reuse them)
+# adaptive retries add a client-side token bucket that backs off on throttling
+_BOTO = Config(region_name=REGION, retries={'mode': 'adaptive', 'max_attempts': 5}, max_pool_connections=10)
+cw = boto3.client('cloudwatch', config=_BOTO)
+ecs = boto3.client('ecs', config=_BOTO)
+# metric dimensions/queries are fixed for a given Lambda config, so build them once at cold start
+_DIMS = [{'Name': 'ClusterName', 'Value': CLUSTER}, {'Name': 'ServiceName', 'Value': SERVICE}]
+
+_ssm_client = None  # created lazily: only needed when the webhook comes from SSM
+
+def _ssm():
+    global _ssm_client
+    _ssm_client = _ssm_client or boto3.client('ssm', config=_BOTO)
+    return _ssm_client
+
+_SLACK_CACHE = {'value': None, 'ts': 0.0}
+
+# worker pool for the AWS fan-out, reused across warm invocations
+_POOL = ThreadPoolExecutor(max_workers=4)
+
+# pooled HTTP for Slack (urllib3 ships with botocore) so warm invocations reuse the TLS connection
+_HTTP = urllib3.PoolManager(num_pools=1, maxsize=2, retries=urllib3.Retry(total=1))
 
 def get_slack_webhook():
     if SLACK_WEBHOOK:
         return SLACK_WEBHOOK
     if SLACK_WEBHOOK_PARAM:
+        now = time.time()
+        if _SLACK_CACHE['value'] and now - _SLACK_CACHE['ts'] < SLACK_WEBHOOK_TTL:
+            return _SLACK_CACHE['value']
         try:
-            resp = ssm.get_parameter(Name=SLACK_WEBHOOK_PARAM, WithDecryption=True)
-            return resp['Parameter']['Value']
+            resp = _ssm().get_parameter(Name=SLACK_WEBHOOK_PARAM, WithDecryption=True)
+            _SLACK_CACHE['value'] = resp['Parameter']['Value']
+            _SLACK_CACHE['ts'] = now
+            return _SLACK_CACHE['value']
         except ClientError:
             LOG.exception('Failed to get Slack webhook from SSM param: %s', SLACK_WEBHOOK_PARAM)
     return None
 
-def notify_slack(text):
+def _post_slack(webhook, text):
+    # fixed payload shape: only the string value needs JSON escaping
+    payload = b'{"text":' + json.dumps(text).encode('utf-8') + b'}'
+    try:
+        res = _HTTP.request('POST', webhook, body=payload, headers={'Content-Type': 'application/json'},
+                            timeout=urllib3.Timeout(connect=2, read=6))
+        # urllib3 doesn't raise on HTTP errors (revoked webhook, Slack 5xx), so check explicitly
+        if res.status >= 300:
+            LOG.error('Slack notification failed, status=%s body=%s', res.status, res.data[:200])
+        else:
+            LOG.info('Slack notified, status=%s', res.status)
+    except Exception as e:
+        LOG.exception('Failed to send slack notification: %s', e)
+
+# messages buffered during an invocation, sent as one webhook POST at the end
+_PENDING = []
+
+def queue_slack(text):
+    _PENDING.append(text)
+
+def _flush_slack():
+    # snapshot and resolve the webhook synchronously (SSM on a cold start), POST in the background
+    if not _PENDING:
+        return
+    text = '\n'.join(_PENDING)
+    _PENDING.clear()
     webhook = get_slack_webhook()
     if not webhook:
         LOG.info('No Slack webhook configured, skipping notification: %s', text)
         return
-    payload = json.dumps({'text': text}).encode('utf-8')
-    req = urllib.request.Request(webhook, data=payload, headers={'Content-Type': 'application/json'})
-    try:
-        res = urllib.request.urlopen(req, timeout=8)
-        LOG.info('Slack notified, status=%s', res.status)
-    except Exception as e:
-        LOG.exception('Failed to send slack notification: %s', e)
+    t = Thread(target=_post_slack, args=(webhook, text))
+    t.start()
+    # short grace period only: a POST still running when the Lambda freezes resumes on the
+    # next warm invocation, so the message is delayed rather than lost
+    t.join(timeout=SLACK_JOIN_TIMEOUT)
+    if t.is_alive():
+        LOG.warning('Slack notification still in flight at return, will complete on next warm invoke: %s', text)
 
-def fetch_cw_metric(namespace, name, dimensions, start_time, end_time, period):
+def metric_queries(namespace, name, dimensions, period):
+    return [{
+        'Id': 'm1',
+        'MetricStat': {
+            'Metric': {'Namespace': namespace, 'MetricName': name, 'Dimensions': dimensions},
+            'Period': period,
+            'Stat': 'Average'
+        },
+        'ReturnData': True
+    }]
+
+_MDQ = metric_queries(METRIC_NAMESPACE, METRIC_NAME, _DIMS, PERIOD)
+
+def fetch_metric_data(queries, start_time, end_time):
+    # GetMetricData: one round-trip for up to 500 queries, values come back ordered
     try:
-        resp = cw.get_metric_statistics(
-            Namespace=namespace,
-            MetricName=name,
-            Dimensions=dimensions,
+        resp = cw.get_metric_data(
+            MetricDataQueries=queries,
             StartTime=start_time,
             EndTime=end_time,
-            Period=period,
-            Statistics=['Average']
+            ScanBy='TimestampAscending'
         )
-        dps = resp.get('Datapoints', [])
-        # sort ascending by timestamp
-        dps_sorted = sorted(dps, key=lambda x: x['Timestamp'])
-        return [dp['Average'] for dp in dps_sorted]
+        results = resp.get('MetricDataResults', [])
+        if not results:
+            return [], []
+        # timestamps as epoch seconds so they can be persisted with the Holt state
+        timestamps = list(map(datetime.timestamp, results[0].get('Timestamps', [])))
+        return timestamps, results[0].get('Values', [])
     except Exception:
         LOG.exception('Error fetching metric from CloudWatch')
-        return []
+        return [], []
+
+NUMBA_MIN_POINTS = 256  # below this the JIT dispatch overhead outweighs the loop
+
+def _holt_array(values, level, trend, alpha, beta):
+    # array form of the Holt loop, compiled with Numba when available
+    one_m_a = 1.0 - alpha
+    one_m_b = 1.0 - beta
+    for i in range(values.shape[0]):
+        last_level = level
+        level = alpha * values[i] + one_m_a * (level + trend)
+        trend = beta * (level - last_level) + one_m_b * trend
+    return level, trend
+
+# optional numpy/numba are imported on the first long series only, so cold starts (and the
+# usual one-point incremental update) never pay for them; False once known unavailable
+_holt_core = None
+
+def _get_holt_core():
+    global _holt_core
+    if _holt_core is None:
+        try:
+            from numba import njit
+            _holt_core = njit(fastmath=True)(_holt_array)
+        except ImportError:
+            LOG.info('Numba not installed, using pure-Python Holt loop')
+            _holt_core = False
+        except Exception:
+            LOG.exception('Numba unavailable for Holt smoothing, using pure-Python loop')
+            _holt_core = False
+    return _holt_core
 
-def double_exponential_smoothing(series, alpha=0.5, beta=0.3, n_preds=1):
+def holt_update(level, trend, values, alpha=HOLT_ALPHA, beta=HOLT_BETA):
+    # advance Holt level/trend over values (in timestamp order)
+    global _holt_core
+    if len(values) >= NUMBA_MIN_POINTS and _get_holt_core():
+        try:
+            import numpy as np
+            arr = np.asarray(values, dtype=np.float64)
+            return _holt_core(arr, float(level), float(trend), float(alpha), float(beta))
+        except Exception:
+            # compilation happens on first call; don't retry a broken JIT every invocation
+            LOG.exception('Numba Holt smoothing failed, falling back to pure-Python loop')
+            _holt_core = False
+    # hoist loop invariants
+    one_m_a = 1.0 - alpha
+    one_m_b = 1.0 - beta
+    for value in values:
+        last_level = level
+        level = alpha * value + one_m_a * (level + trend)
+        trend = beta * (level - last_level) + one_m_b * trend
+    return level, trend
+
+def double_exponential_smoothing(series, alpha=HOLT_ALPHA, beta=HOLT_BETA, n_preds=1):
     # Holt's linear method (level + trend)
     if not series:
         return 0.0
     if len(series) == 1:
         return series[0]
     # initialize level and trend
-    level = series[0]
-    trend = series[1] - series[0]
-    for i in range(1, len(series)):
-        value = series[i]
-        last_level = level
-        level = alpha * value + (1 - alpha) * (level + trend)
-        trend = beta * (level - last_level) + (1 - beta) * trend
+    level, trend = holt_update(series[0], series[1] - series[0], series[1:], alpha, beta)
     # forecast n_preds steps ahead
     forecast = level + trend * n_preds
-    return max(0.0, float(forecast))
+    return forecast if forecast > 0.0 else 0.0
+
+def load_holt_state(key):
+    try:
+        with open(HOLT_STATE_PATH) as f:
+            return json.load(f).get(key)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        LOG.exception('Failed to read Holt state from %s', HOLT_STATE_PATH)
+        return None
+
+def save_holt_state(key, state):
+    try:
+        try:
+            with open(HOLT_STATE_PATH) as f:
+                states = json.load(f)
+        except (OSError, ValueError):
+            states = {}
+        states[key] = state
+        tmp = HOLT_STATE_PATH + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(states, f)
+        os.replace(tmp, HOLT_STATE_PATH)
+    except OSError:
+        LOG.exception('Failed to write Holt state to %s', HOLT_STATE_PATH)
+
+def incremental_smoothing(key, timestamps, series, alpha=HOLT_ALPHA, beta=HOLT_BETA, n_preds=1):
+    # Same forecast as double_exponential_smoothing over the full history, but level/trend are
+    # persisted between invocations so only datapoints newer than the last seen timestamp are processed.
+    if not series:
+        return 0.0
+    state = load_holt_state(key)
+    # reuse state only if it still overlaps the fetched window (no gap in history)
+    if state and timestamps[0] <= state['last_ts']:
+        level, trend, last_ts = state['level'], state['trend'], state['last_ts']
+    elif len(series) == 1:
+        return series[0] if series[0] > 0.0 else 0.0
+    else:
+        level, trend, last_ts = series[0], series[1] - series[0], timestamps[0]
+    # CloudWatch can still revise the newest bucket as late samples arrive, so persist state only
+    # through the bucket before it and apply the newest one transiently for this forecast
+    settled = [v for ts, v in zip(timestamps[:-1], series[:-1]) if ts > last_ts]
+    if settled:
+        level, trend = holt_update(level, trend, settled, alpha, beta)
+        last_ts = timestamps[-2]
+        save_holt_state(key, {'level': level, 'trend': trend, 'last_ts': last_ts})
+    if timestamps[-1] > last_ts:
+        level, trend = holt_update(level, trend, series[-1:], alpha, beta)
+    forecast = level + trend * n_preds
+    return forecast if forecast > 0.0 else 0.0
+
+def _check_incremental_smoothing():
+    # local self-check: replay a synthetic metric one bucket per invocation (each bucket first
+    # seen partial, then revised) and compare against a full-history recompute
+    import tempfile
+    global HOLT_STATE_PATH
+    saved_path = HOLT_STATE_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        HOLT_STATE_PATH = os.path.join(tmp, 'holt_state.json')
+        try:
+            history = [40.0 + 3 * i + (i % 4) * 5 for i in range(40)]
+            window = max(2, LOOKBACK_MINUTES * 60 // PERIOD)
+            for n in range(1, len(history) + 1):
+                ts = [i * PERIOD for i in range(n)][-window:]
+                values = history[:n][-window:]
+                incremental_smoothing('check', ts, values[:-1] + [values[-1] * 0.5], n_preds=N_AHEAD)
+                got = incremental_smoothing('check', ts, values, n_preds=N_AHEAD)
+                want = double_exponential_smoothing(history[:n], n_preds=N_AHEAD)
+                assert abs(got - want) < 1e-9, (n, got, want)
+        finally:
+            HOLT_STATE_PATH = saved_path
 
 def describe_service(cluster, service):
     resp = ecs.describe_services(cluster=cluster, services=[service])
     svc = resp.get('services', [])[0]
     return svc
 
+DESCRIBE_TASKS_MAX = 100  # DescribeTasks hard limit on ARNs per call
+
+def list_task_arns(cluster, service, status):
+    # paginate so services with >100 tasks are counted correctly
+    paginator = ecs.get_paginator('list_tasks')
+    pages = paginator.paginate(cluster=cluster, serviceName=service, desiredStatus=status,
+                               PaginationConfig={'PageSize': 100})
+    return [arn for page in pages for arn in page.get('taskArns', [])]
+
+def describe_tasks_chunked(cluster, arns):
+    for i in range(0, len(arns), DESCRIBE_TASKS_MAX):
+        resp = ecs.describe_tasks(cluster=cluster, tasks=arns[i:i + DESCRIBE_TASKS_MAX])
+        yield from resp.get('tasks', [])
+
 def list_and_describe_tasks(cluster, service):
-    arns = ecs.list_tasks(cluster=cluster, serviceName=service, desiredStatus='RUNNING').get('taskArns', [])
-    if not arns:
-        return []
-    resp = ecs.describe_tasks(cluster=cluster, tasks=arns)
-    return resp.get('tasks', [])
+    arns = list_task_arns(cluster, service, 'RUNNING')
+    return list(describe_tasks_chunked(cluster, arns))
+
+def recent_unexpected_stops(cluster, arns, since_ts):
+    # ECS keeps stopped tasks ~1h, including the ones the scheduler stops for our own
+    # scale-downs / redeploys; only tasks that stopped on their own inside the window count
+    return [t for t in describe_tasks_chunked(cluster, arns)
+            if t.get('stopCode') != 'ServiceSchedulerInitiated'
+            and t.get('stoppedAt') and t['stoppedAt'].timestamp() >= since_ts]
+
+def stopped_task_reasons(tasks):
+    return sorted({t.get('stoppedReason', 'unknown') for t in tasks})
 
-def heal_if_needed(cluster, service):
+def heal_if_needed(cluster, service, svc=None, stopped_arns=None):
     # Basic heuristic: if runningCount < desiredCount or recent stopped tasks > threshold -> force new deployment
-    svc = describe_service(cluster, service)
+    # svc / stopped_arns are normally pre-fetched by the handler; omitted ones are looked up (local testing)
+    if svc is None:
+        svc = describe_service(cluster, service)
     desired = svc.get('desiredCount', 1)
     running = svc.get('runningCount', 0)
     LOG.info('Service desired=%s running=%s', desired, running)
-    # list stopped tasks for last few minutes (via describe_tasks for recent tasks)
-    tasks_all = ecs.list_tasks(cluster=cluster, serviceName=service).get('taskArns', [])
-    stopped = 0
-    if tasks_all:
-        desc = ecs.describe_tasks(cluster=cluster, tasks=tasks_all)
-        for t in desc.get('tasks', []):
-            if t.get('lastStatus') == 'STOPPED':
-                stopped += 1
+    if running < desired and not HEAL_DESCRIBE_STOPPED:
+        # already healing; the stopped-task count (a describe_tasks per 100 ARNs) can't change that
+        stopped_tasks, stopped = [], 'not checked'
+        unhealthy = True
+    else:
+        if stopped_arns is None:
+            stopped_arns = list_task_arns(cluster, service, 'STOPPED')
+        stopped_tasks = recent_unexpected_stops(cluster, stopped_arns, time.time() - LOOKBACK_MINUTES * 60)
+        stopped = len(stopped_tasks)
+        # runningCount from the service stands in for listing RUNNING task ARNs
+        total = running + stopped
+        # threshold based decision
+        unhealthy = running < desired or stopped >= max(1, math.ceil(0.2 * max(1, total)))
     LOG.info('stopped tasks count=%s', stopped)
-    # threshold based decision
-    if running < desired or stopped >= max(1, math.ceil(0.2 * max(1, len(tasks_all)))):
+    if unhealthy:
         try:
             ecs.update_service(cluster=cluster, service=service, forceNewDeployment=True)
-            notify_slack(f':wrench: Self-heal: forced new deployment for {service} (running={running} desired={desired} stopped={stopped})')
+            msg = f':wrench: Self-heal: forced new deployment for {service} (running={running} desired={desired} stopped={stopped})'
+            if HEAL_DESCRIBE_STOPPED and stopped_tasks:
+                msg += '\nStop reasons: ' + '; '.join(stopped_task_reasons(stopped_tasks))
+            queue_slack(msg)
             LOG.info('Forced new deployment for %s', service)
             return True
         except Exception:
@@ -144,38 +362,60 @@ def heal_if_needed(cluster, service):
 def scale_service(cluster, service, new_desired):
     try:
         ecs.update_service(cluster=cluster, service=service, desiredCount=int(new_desired))
-        notify_slack(f':rocket: Scaling action: set desiredCount={new_desired} for {service}')
+        queue_slack(f':rocket: Scaling action: set desiredCount={new_desired} for {service}')
         LOG.info('Scaled service %s to %s', service, new_desired)
         return True
     except Exception:
         LOG.exception('Failed to update service desired count')
-        notify_slack(f':x: Failed to scale {service} to {new_desired}')
+        queue_slack(f':x: Failed to scale {service} to {new_desired}')
         return False
 
 def lambda_handler(event, context=None):
+    try:
+        return _handle(event)
+    finally:
+        _flush_slack()
+
+def _handle(event):
     LOG.info('Lambda invoked, event=%s', event)
     # fetch metrics
-    end = datetime.utcnow()
-    start = end - timedelta(minutes=LOOKBACK_MINUTES)
-    dims = [{'Name': 'ClusterName', 'Value': CLUSTER}, {'Name': 'ServiceName', 'Value': SERVICE}]
-    series = fetch_cw_metric(METRIC_NAMESPACE, METRIC_NAME, dims, start, end, PERIOD)
-    LOG.info('Fetched series (len=%d): %s', len(series), series)
+    # align the window to PERIOD boundaries so CloudWatch returns whole, stable buckets
+    now = int(time.time())
+    end_ts = now - (now % PERIOD)
+    start_ts = end_ts - LOOKBACK_MINUTES * 60
+    end = datetime.fromtimestamp(end_ts, tz=timezone.utc)
+    start = datetime.fromtimestamp(start_ts, tz=timezone.utc)
+    timestamps, series = fetch_metric_data(_MDQ, start, end)
+    LOG.info('Fetched series len=%d', len(series))
+    # full series only at DEBUG: CloudWatch Logs bills per byte
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug('Fetched series (len=%d): %s', len(series), series)
+    # no data (deployments / quiet periods): skip all ECS calls
     if not series:
-        notify_slack(f':grey_question: Agent: no metric datapoints for {SERVICE}')
+        queue_slack(f':grey_question: Agent: no metric datapoints for {SERVICE}')
         return {'status': 'no_data'}
+    # independent ECS calls are network-bound, so fan them out concurrently
+    f_svc = _POOL.submit(describe_service, CLUSTER, SERVICE)
+    f_stopped = _POOL.submit(list_task_arns, CLUSTER, SERVICE, 'STOPPED')
     # forecast
-    # number of periods ahead roughly PREDICT_AHEAD_MIN * 60 / PERIOD
-    n_ahead = max(1, math.ceil(PREDICT_AHEAD_MIN * 60 / PERIOD))
-    pred = double_exponential_smoothing(series, n_preds=n_ahead)
+    state_key = f'{CLUSTER}/{SERVICE}/{METRIC_NAMESPACE}/{METRIC_NAME}'
+    pred = incremental_smoothing(state_key, timestamps, series, alpha=HOLT_ALPHA, beta=HOLT_BETA, n_preds=N_AHEAD)
     LOG.info('Predicted %s ahead by %s min = %.2f', METRIC_NAME, PREDICT_AHEAD_MIN, pred)
-    svc = describe_service(CLUSTER, SERVICE)
+    svc = f_svc.result()
+    stopped_arns = f_stopped.result()
     desired = svc.get('desiredCount', 1)
     running = svc.get('runningCount', 0)
     # compute required tasks: if predicted average CPU per task * desired > TARGET_CPU_PER_TASK -> scale
     # For demo we approximate pred ~ avg CPU utilization per task; required_tasks = ceil(pred/(TARGET_CPU_PER_TASK/100) * desired)
     # Simpler: required_tasks = ceil((pred/100.0) * desired / (TARGET_CPU_PER_TASK/100.0)) => ceil(pred * desired / TARGET_CPU_PER_TASK)
     try:
-        required = max(1, math.ceil((pred * desired) / TARGET_CPU_PER_TASK))
+        # integer ceildiv on values scaled to 0.01 percentage points. Rounding (not truncating)
+        # the operands makes exact multiples land exactly, e.g. pred=166.5, target=33.3 -> 5, where
+        # float division can overshoot by one. Boundary: a load within 0.005 points above an exact
+        # multiple of the target is treated as that multiple and does not add a task.
+        scaled = round(pred * desired * 100)
+        divisor = round(TARGET_CPU_PER_TASK * 100)
+        required = max(1, (scaled + divisor - 1) // divisor)
     except Exception:
         required = desired
     LOG.info('Calculated required tasks=%s (desired=%s running=%s)', required, desired, running)
@@ -191,11 +431,13 @@ def lambda_handler(event, context=None):
             LOG.info('No downscale (safe guard)')
     else:
         LOG.info('No scaling action required')
-    # healing
-    healed = heal_if_needed(CLUSTER, SERVICE)
+    # healing runs after scaling so the two update_service calls never race
+    healed = heal_if_needed(CLUSTER, SERVICE, svc=svc, stopped_arns=stopped_arns)
     return {'status': 'ok', 'predicted': pred, 'desired': desired, 'required': required, 'healed': healed}
 
 if __name__ == '__main__':
     # local run for testing
     print('Local test run (simulated)')
+    _check_incremental_smoothing()
+    print('Incremental smoothing matches full recompute')
     print(lambda_handler({}, None))